@@ -55,7 +55,9 @@ cp "$SCRIPT_DIR/src/clipmon" ~/.claude/tools/
 cp "$SCRIPT_DIR/src/clipmon-bg" ~/.claude/tools/
 cp "$SCRIPT_DIR/src/clipmon-gui" ~/.claude/tools/
 cp "$SCRIPT_DIR/src/clipmon-viewer" ~/.claude/tools/
+cp "$SCRIPT_DIR/src/clipmon-archive" ~/.claude/tools/
 cp "$SCRIPT_DIR/src/clipmon-tray" ~/.claude/tools/
+cp "$SCRIPT_DIR/src/clipmon_mainloop.py" ~/.claude/tools/
 cp "$SCRIPT_DIR/src/clipmon-wintray" ~/.claude/tools/
 cp "$SCRIPT_DIR/src/clipmon-systray.py" ~/.claude/tools/
 
@@ -81,6 +83,10 @@ if ! python3 -c "import gi" 2>/dev/null; then
     echo -e "${YELLOW}GTK Python bindings not found.${NC}"
     echo "Install with: sudo apt-get install python3-gi gir1.2-gtk-3.0"
 fi
+if ! python3 -c "import zstandard" 2>/dev/null; then
+    echo -e "${YELLOW}zstandard not found, 'clipmon export' will only write .zip archives.${NC}"
+    echo "Install with: pip3 install --user zstandard"
+fi
 
 # Windows Python check
 echo -e "${CYAN}Checking Windows Python...${NC}"
@@ -0,0 +1,83 @@
+"""
+ClipmonWSL main loop helpers
+Shared by the GTK control panel and tray to keep blocking work off the main loop
+by BuildAppolis (www.buildappolis.com)
+"""
+
+from gi.repository import GLib
+import os
+import sys
+import time
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+# Main loop callbacks slower than one frame (~60fps) are logged as stalls
+FRAME_BUDGET_MS = float(os.environ.get('CLIPMON_FRAME_BUDGET_MS', '16'))
+
+class MainLoopWatchdog:
+    """Time GLib callbacks and log any that overrun the frame budget"""
+    def __init__(self, name, budget_ms=FRAME_BUDGET_MS):
+        self.name = name
+        self.budget_ms = budget_ms
+    
+    def wrap(self, func):
+        """Return func wrapped with stall timing"""
+        label = getattr(func, '__qualname__', repr(func))
+        
+        @functools.wraps(func)
+        def timed(*args):
+            start = time.perf_counter()
+            try:
+                return func(*args)
+            finally:
+                elapsed = (time.perf_counter() - start) * 1000
+                if elapsed > self.budget_ms:
+                    print(f"[{self.name}] main loop stall: {label} took {elapsed:.1f}ms "
+                          f"(budget {self.budget_ms:.0f}ms)", file=sys.stderr)
+        return timed
+    
+    def timeout_add(self, interval, func, *args):
+        return GLib.timeout_add(interval, self.wrap(func), *args)
+    
+    def timeout_add_seconds(self, interval, func, *args):
+        return GLib.timeout_add_seconds(interval, self.wrap(func), *args)
+    
+    def connect(self, widget, signal_name, func, *args):
+        return widget.connect(signal_name, self.wrap(func), *args)
+
+class BackgroundWorker:
+    """Run blocking disk and subprocess work off the GTK main loop
+    
+    Results (or errors) are handed back on the main loop via GLib.idle_add,
+    so callbacks are free to touch widgets. A single worker keeps jobs in
+    order, so reference readers never race the reference pruning writes.
+    """
+    def __init__(self, watchdog, max_workers=1):
+        self.watchdog = watchdog
+        self.executor = ThreadPoolExecutor(max_workers=max_workers,
+                                           thread_name_prefix=watchdog.name)
+    
+    def submit(self, func, *args, callback=None, error_callback=None):
+        """Run func(*args) on a worker thread, deliver the result to callback"""
+        def deliver(handler, value):
+            handler(value)
+            return False  # One-shot idle callback
+        
+        def done(future):
+            try:
+                result = future.result()
+            except Exception as e:
+                if error_callback:
+                    GLib.idle_add(deliver, self.watchdog.wrap(error_callback), e)
+                else:
+                    print(f"Error in background task {func.__name__}: {e}", file=sys.stderr)
+                return
+            if callback:
+                GLib.idle_add(deliver, self.watchdog.wrap(callback), result)
+        
+        future = self.executor.submit(func, *args)
+        future.add_done_callback(done)
+        return future
+    
+    def shutdown(self):
+        self.executor.shutdown(wait=False)